@@ -6,21 +6,24 @@ import dlt
 
 def set_dlt_config(config: dict[str, Any], *, prefix: str = "") -> None:
     """
-    Set DLT secrets recursively from a configuration dictionary.
+    Set DLT secrets from a nested configuration dictionary.
     Supports environment variable resolution for values prefixed with 'env:'.
 
     Args:
         config: Dictionary with configuration values
-        prefix: Dot-separated path prefix for nested keys (internal use)
+        prefix: Dot-separated path prefix for nested keys
     """
-    for key, value in config.items():
-        full_key = f"{prefix}.{key}" if prefix else key
+    stack = [(prefix, config)]
+    while stack:
+        current_prefix, current_config = stack.pop()
+        for key, value in current_config.items():
+            full_key = f"{current_prefix}.{key}" if current_prefix else key
 
-        if isinstance(value, dict):
-            set_dlt_config(value, prefix=full_key)
-            continue
+            if isinstance(value, dict):
+                stack.append((full_key, value))
+                continue
 
-        if isinstance(value, str) and value.startswith("env:"):
-            value = os.getenv(value[4:])  # Strip 'env:' prefix
+            if isinstance(value, str) and value[:4] == "env:":
+                value = os.getenv(value[4:])  # Strip 'env:' prefix
 
-        dlt.secrets[full_key] = value
+            dlt.secrets[full_key] = value
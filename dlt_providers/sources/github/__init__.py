@@ -1,5 +1,6 @@
 import base64
-from typing import Iterable, Literal, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, Literal, Optional, Set
 
 import dlt
 from dlt.common import logger
@@ -7,11 +8,23 @@ from dlt.common.exceptions import DltException
 from dlt.sources import DltResource
 from dlt.sources.helpers.rest_client import RESTClient
 from dlt.sources.helpers.rest_client.auth import BearerTokenAuth
-from dlt.sources.helpers.rest_client.paginators import PageNumberPaginator
-
-from .helpers import GitHubAppAuth
+from dlt.sources.helpers.rest_client.paginators import HeaderLinkPaginator
+
+from .helpers import (
+    FetchChannel,
+    GitHubAppAuth,
+    build_commits_query,
+    create_session,
+    graphql_commit_to_rest,
+    wait_for_rate_limit,
+)
 from .settings import (
     DEFAULT_START_DATE,
+    GRAPHQL_BATCH_SIZE,
+    MAX_RESULTS_PER_QUERY,
+    MAX_WORKERS,
+    PAGE_QUEUE_SIZE,
+    PER_PAGE,
     REST_API_BASE_URL,
 )
 
@@ -26,7 +39,29 @@ def github(
     gha_private_key: Optional[str] = dlt.secrets.value,
     gha_private_key_base64: Optional[str] = dlt.secrets.value,
     start_date: str = DEFAULT_START_DATE,
+    use_graphql: bool = False,
 ) -> Iterable[DltResource]:
+    """
+    GitHub source loading repositories, commits and workflow runs of an organization.
+
+    Args:
+        org: The GitHub organization to load data from.
+        auth_type: Authenticate with a personal access token ("pat") or a GitHub App ("gha").
+        access_token: The personal access token, used with "pat".
+        gha_installation_id: The GitHub App installation id, used with "gha".
+        gha_client_id: The GitHub App client id, used with "gha".
+        gha_private_key: The GitHub App private key in PEM format, used with "gha".
+        gha_private_key_base64: The base64 encoded private key, used when `gha_private_key` is not set.
+        start_date: Load commits and workflow runs created after this date.
+        use_graphql: Fetch commits with batched GraphQL queries instead of REST.
+            Commits are mapped onto the REST layout, except for fields GraphQL does not
+            expose: `commit.verification.verified_at` and the `*_url` templates of users.
+            Only the first 10 parents of a commit are loaded.
+    Returns:
+        Iterable[DltResource]: The repositories, commits and workflow_runs resources.
+    """
+    session = create_session()
+
     match auth_type:
         case "pat":
             auth = BearerTokenAuth(token=access_token)
@@ -39,164 +74,413 @@ def github(
                 or base64.b64decode(gha_private_key_base64).decode("utf-8"),
                 auth_endpoint=f"https://api.github.com/app/installations/{gha_installation_id}/access_tokens",
                 scopes=[],  # HACK: GitHubAppAuth does not require scopes, but we need to set it to empty list to avoid error
+                session=session,
             )
         case _:
             raise DltException(
                 f"Invalid auth type {auth_type}. Must be one of ['pat', 'gha']"
             )
 
-    client = RESTClient(
-        base_url=REST_API_BASE_URL,
-        auth=auth,
-        paginator=PageNumberPaginator(
-            base_page=1,
-            page_param="page",
-            total_path=None,
-        ),
-    )
+    def _build_client() -> RESTClient:
+        """Build a REST client bound to the shared session.
+        Every batch of work builds its own client as defensive isolation between
+        worker threads. This is not a thread-safety requirement, since
+        `RESTClient.paginate` already copies the paginator on every call.
+        The shared session still provides the connection pool.
 
-    @dlt.resource(write_disposition="merge", primary_key="id")
-    def repositories():
-        """Load GitHub repositories data.
+        Returns:
+            REST client for the GitHub API
+        """
+        return RESTClient(
+            base_url=REST_API_BASE_URL,
+            auth=auth,
+            paginator=HeaderLinkPaginator(),
+            session=session,
+        )
+
+    @dlt.resource(selected=False)
+    def repository_pages():
+        """List GitHub repository pages of the organization.
+        Pages are requested conditionally with the ETag from the previous run.
+        Unchanged pages are answered with 304 Not Modified, which does not count
+        against the rate limit, and are replayed from the repository names kept
+        in the resource state, so the commits and workflow runs transformers
+        still see every repository.
 
         Yields:
-            Paginated repository data for the organization
+            Pages with the repositories and whether they changed since the previous run
         """
-        yield from client.paginate(
-            path=f"/orgs/{org}/repos",
-            params={"per_page": 100, "sort": "updated", "direction": "desc"},
-        )
+        cached_pages = dlt.current.resource_state().setdefault("pages", {})
+        url = f"{REST_API_BASE_URL}/orgs/{org}/repos"
+        params = {"per_page": PER_PAGE, "sort": "updated", "direction": "desc"}
+
+        while url:
+            cached = cached_pages.get(url)
+            headers = {"If-None-Match": cached["etag"]} if cached else None
+
+            response = session.get(url, params=params, headers=headers, auth=auth)
+            response.raise_for_status()
+            wait_for_rate_limit(response)
+
+            # Next page URLs already carry the query parameters
+            params = None
+
+            if response.status_code == 304:
+                logger.debug(f"Repositories page {url} not modified")
+                yield {
+                    "repositories": [
+                        {"full_name": full_name} for full_name in cached["full_names"]
+                    ],
+                    "modified": False,
+                }
+                url = cached["next"]
+                continue
+
+            page = response.json()
+            next_url = response.links.get("next", {}).get("url")
+            if response.headers.get("ETag"):
+                cached_pages[url] = {
+                    "etag": response.headers["ETag"],
+                    "next": next_url,
+                    "full_names": [repository["full_name"] for repository in page],
+                }
+
+            yield {"repositories": page, "modified": True}
+            url = next_url
 
     @dlt.transformer(
-        data_from=repositories, primary_key="sha", write_disposition="merge"
+        data_from=repository_pages, primary_key="id", write_disposition="merge"
     )
-    def commits(repositories):
-        """Transform and load GitHub commits data with checkpointing.
+    def repositories(page):
+        """Load GitHub repositories data.
+        Only pages that changed since the previous run are written.
 
         Args:
-            repositories: Iterator of repository data from GitHub API
+            page: Repository page from GitHub API
 
         Yields:
-            Paginated commit data for each repository
+            Paginated repository data for the organization
         """
-        checkpoints = dlt.current.resource_state().setdefault("checkpoints", {})
+        if page["modified"]:
+            yield page["repositories"]
 
-        for repository in repositories:
-            repo_full_name = repository["full_name"]
-            try:
-                # Initialize checkpoint and tracking variables
-                checkpoint = checkpoints.get(repo_full_name, start_date)
-                latest_commit_date = None
-
-                # Get paginated commits since last checkpoint
-                pages = client.paginate(
-                    path=f"/repos/{repo_full_name}/commits",
-                    params={"per_page": 100, "since": checkpoint},
+    def _fetch_commits_for_repo(
+        client: RESTClient, channel: FetchChannel, repo_full_name: str, checkpoint: str
+    ) -> None:
+        """Fetch commit pages of a repository since the checkpoint.
+        Every page is sent as soon as it arrives, followed by a final message
+        carrying the latest commit date.
+
+        Args:
+            client: REST client used by the calling worker only
+            channel: Channel receiving the pages of the repository
+            repo_full_name: Full name of the repository (owner/name)
+            checkpoint: Commit date to fetch commits since
+        """
+        latest_commit_date = None
+
+        # Get paginated commits since last checkpoint
+        pages = client.paginate(
+            path=f"/repos/{repo_full_name}/commits",
+            params={"per_page": PER_PAGE, "since": checkpoint},
+        )
+
+        for page in pages:
+            wait_for_rate_limit(page.response, sleep=channel.stopped.wait)
+
+            # Track most recent commit date from first page
+            if latest_commit_date is None and page:
+                latest_commit_date = page[0]["commit"]["committer"]["date"]
+            if not channel.send(("page", repo_full_name, page)):
+                return
+
+        channel.send(("done", repo_full_name, latest_commit_date))
+
+    def _fetch_commits_graphql(
+        client: RESTClient,
+        channel: FetchChannel,
+        checkpoints_by_repo: Dict[str, str],
+        finished: Set[str],
+    ) -> None:
+        """Fetch commits of several repositories with batched GraphQL queries.
+        Every query aliases all repositories that still have pages left, so a
+        batch costs one request per page of its longest history. Pages are sent
+        as they arrive and each repository is finished with its latest commit date.
+
+        Args:
+            client: REST client used by the calling worker only
+            channel: Channel receiving the pages of the repositories
+            checkpoints_by_repo: Commit date to fetch commits since, by repository full name
+            finished: Collects the repositories whose final message was sent
+        """
+        latest_commit_dates = dict.fromkeys(checkpoints_by_repo)
+        cursors = dict.fromkeys(checkpoints_by_repo)
+        pending = list(checkpoints_by_repo)
+
+        while pending:
+            variables = {}
+            for i, repo_full_name in enumerate(pending):
+                owner, name = repo_full_name.split("/", 1)
+                variables.update(
+                    {
+                        f"owner{i}": owner,
+                        f"name{i}": name,
+                        f"since{i}": checkpoints_by_repo[repo_full_name],
+                        f"after{i}": cursors[repo_full_name],
+                    }
                 )
 
-                for page in pages:
-                    if not page:
-                        break
+            response = client.post(
+                "/graphql",
+                json={"query": build_commits_query(len(pending)), "variables": variables},
+            )
+            response.raise_for_status()
+            wait_for_rate_limit(response, sleep=channel.stopped.wait)
+
+            body = response.json()
+            if body.get("errors"):
+                raise DltException(f"GraphQL query failed: {body['errors']}")
+
+            still_pending = []
+            for i, repo_full_name in enumerate(pending):
+                branch = body["data"][f"repo{i}"]["defaultBranchRef"]
+                history = branch["target"]["history"] if branch else None
+
+                # Empty repositories have no default branch
+                if history is not None:
+                    page = [
+                        graphql_commit_to_rest(node, repo_full_name)
+                        for node in history["nodes"]
+                    ]
 
                     # Track most recent commit date from first page
-                    if latest_commit_date is None:
-                        latest_commit_date = page[0]["commit"]["committer"]["date"]
-                    yield page
+                    if latest_commit_dates[repo_full_name] is None and page:
+                        latest_commit_dates[repo_full_name] = page[0]["commit"]["committer"]["date"]
+                    if not channel.send(("page", repo_full_name, page)):
+                        return
 
-                # Update checkpoint after successful processing
-                if latest_commit_date:
-                    checkpoints[repo_full_name] = latest_commit_date
-                    logger.info(
-                        f"Updated commits checkpoint for {repo_full_name} to {latest_commit_date}"
-                    )
+                    if history["pageInfo"]["hasNextPage"]:
+                        cursors[repo_full_name] = history["pageInfo"]["endCursor"]
+                        still_pending.append(repo_full_name)
+                        continue
+
+                channel.send(("done", repo_full_name, latest_commit_dates[repo_full_name]))
+                finished.add(repo_full_name)
+
+            pending = still_pending
 
+    def _fetch_commits(channel: FetchChannel, checkpoints_by_repo: Dict[str, str]) -> None:
+        """Fetch commits of a batch of repositories via GraphQL or REST.
+        Falls back to per-repository REST calls for the unfinished repositories
+        when the GraphQL query fails. Pages already sent for them are fetched
+        again and deduplicated by the merge on `sha`.
+
+        Args:
+            channel: Channel receiving the pages of the repositories
+            checkpoints_by_repo: Commit date to fetch commits since, by repository full name
+        """
+        client = _build_client()
+        if use_graphql:
+            finished = set()
+            try:
+                _fetch_commits_graphql(client, channel, checkpoints_by_repo, finished)
+                return
             except Exception as e:
-                logger.error(
-                    f"Failed to process commits for {repo_full_name}: {str(e)}"
+                checkpoints_by_repo = {
+                    repo_full_name: checkpoint
+                    for repo_full_name, checkpoint in checkpoints_by_repo.items()
+                    if repo_full_name not in finished
+                }
+                logger.warning(
+                    f"Falling back to REST for commits of {', '.join(checkpoints_by_repo)}: {str(e)}"
                 )
-                continue
 
-    @dlt.transformer(
-        data_from=repositories, primary_key="id", write_disposition="merge"
-    )
-    def workflow_runs(repositories):
-        """Transform and load GitHub workflow runs data with checkpointing.
+        for repo_full_name, checkpoint in checkpoints_by_repo.items():
+            if channel.stopped.is_set():
+                return
+            _fetch_commits_for_repo(client, channel, repo_full_name, checkpoint)
+
+    def _fetch_workflow_runs_for_repo(
+        client: RESTClient, channel: FetchChannel, repo_full_name: str, checkpoint: str
+    ) -> None:
+        """Fetch workflow run pages of a repository since the checkpoint.
         Handles GitHub's 1000 results per query limit by fetching all pages
-        before updating the time window.
+        before updating the time window. Every page is sent as soon as it
+        arrives, followed by a final message carrying the latest run date.
 
         Args:
+            client: REST client used by the calling worker only
+            channel: Channel receiving the pages of the repository
+            repo_full_name: Full name of the repository (owner/name)
+            checkpoint: Run creation date to fetch workflow runs since
+        """
+        cursor = "*"
+        latest_run_date = None
+
+        while True:
+            page_count = 0
+            oldest_run_date = None
+
+            # Get paginated workflow runs with cursor-based navigation
+            pages = client.paginate(
+                path=f"/repos/{repo_full_name}/actions/runs",
+                params={
+                    "per_page": PER_PAGE,
+                    "created": f"{checkpoint}..{cursor}",
+                },
+                data_selector="workflow_runs",
+            )
+
+            # Process all pages for current time window
+            for page in pages:
+                wait_for_rate_limit(page.response, sleep=channel.stopped.wait)
+                if not page:
+                    break
+
+                # Track most recent run date from first result
+                if latest_run_date is None:
+                    latest_run_date = page[0]["created_at"]
+
+                # Track oldest run date from last result
+                oldest_run_date = page[-1]["created_at"]
+
+                if not channel.send(("page", repo_full_name, page)):
+                    return
+                page_count += 1
+
+            # Stop unless the window hit GitHub's results per query limit
+            if page_count < MAX_RESULTS_PER_QUERY // PER_PAGE:
+                break
+
+            # Update cursor to oldest run date for next iteration
+            cursor = oldest_run_date
+            logger.debug(f"Updating cursor to {cursor} for {repo_full_name}")
+
+        channel.send(("done", repo_full_name, latest_run_date))
+
+    def _fetch_workflow_runs(
+        channel: FetchChannel, checkpoints_by_repo: Dict[str, str]
+    ) -> None:
+        """Fetch workflow runs of a batch of repositories via REST.
+
+        Args:
+            channel: Channel receiving the pages of the repositories
+            checkpoints_by_repo: Run creation date to fetch workflow runs since, by repository full name
+        """
+        client = _build_client()
+        for repo_full_name, checkpoint in checkpoints_by_repo.items():
+            if channel.stopped.is_set():
+                return
+            _fetch_workflow_runs_for_repo(client, channel, repo_full_name, checkpoint)
+
+    def _load_with_checkpoints(
+        fetch: Callable[[FetchChannel, Dict[str, str]], None],
+        repositories: Iterable[Dict[str, Any]],
+        batch_size: int,
+        name: str,
+    ) -> Iterator[Dict[str, Any]]:
+        """Fetch batches of repositories concurrently and advance their checkpoints.
+        Workers send every page through a bounded channel as soon as it arrives,
+        so records are yielded while fetching is still going on. Each repository
+        keeps its own checkpoint in the resource state, which is moved forward
+        only when its final message is consumed. Closing the generator stops
+        the workers instead of waiting for the remaining repositories.
+
+        Args:
+            fetch: Function fetching a batch of repositories since their checkpoints
             repositories: Iterator of repository data from GitHub API
+            batch_size: Number of repositories passed to a single fetch call
+            name: Human readable name of the fetched data, used in logs
 
         Yields:
-            Paginated workflow runs data for each repository
+            Individual records for each repository
         """
         checkpoints = dlt.current.resource_state().setdefault("checkpoints", {})
-
-        for repository in repositories:
-            repo_full_name = repository["full_name"]
+        repo_full_names = [repository["full_name"] for repository in repositories]
+        batches = [
+            {
+                repo_full_name: checkpoints.get(repo_full_name, start_date)
+                for repo_full_name in repo_full_names[i : i + batch_size]
+            }
+            for i in range(0, len(repo_full_names), batch_size)
+        ]
+        channel = FetchChannel(maxsize=PAGE_QUEUE_SIZE)
+
+        def _run(checkpoints_by_repo: Dict[str, str]) -> None:
             try:
-                # Initialize checkpoint and tracking variables
-                checkpoint = checkpoints.get(repo_full_name, start_date)
-                cursor = "*"
-                latest_run_date = None
-
-                while True:
-                    in_limit = True
-                    oldest_run_date = None
-
-                    # Get paginated workflow runs with cursor-based navigation
-                    pages = client.paginate(
-                        path=f"/repos/{repo_full_name}/actions/runs",
-                        params={
-                            "per_page": 100,
-                            "created": f"{checkpoint}..{cursor}",
-                        },
-                        data_selector="workflow_runs",
-                    )
-
-                    # Process all pages for current time window
-                    for idx, page in enumerate(pages):
-                        if not page:
-                            break
-
-                        # Track most recent run date from first result
-                        if latest_run_date is None and page:
-                            latest_run_date = page[0]["created_at"]
-
-                        # Track oldest run date from last result
-                        if page:
-                            oldest_run_date = page[-1]["created_at"]
-
-                        yield page
-
-                        # Set in_limit to False if we have reached the 1000 results limit
-                        if idx >= 9:
-                            in_limit = False
-
-                    # Break conditions:
-                    # 1. No results in this window
-                    # 2. In limit and no more pages to fetch
-                    if not page or in_limit:
-                        break
-
-                    # Update cursor to oldest run date for next iteration
-                    if oldest_run_date:
-                        cursor = oldest_run_date
-                        logger.debug(
-                            f"Updating cursor to {cursor} for {repo_full_name}"
-                        )
-
-                # Update checkpoint after all pages are processed
-                if latest_run_date:
-                    checkpoints[repo_full_name] = latest_run_date
-                    logger.info(
-                        f"Updated workflow runs checkpoint for {repo_full_name} to {latest_run_date}"
-                    )
-
+                fetch(channel, checkpoints_by_repo)
             except Exception as e:
                 logger.error(
-                    f"Failed to process workflow runs for {repo_full_name}: {str(e)}"
+                    f"Failed to process {name} for {', '.join(checkpoints_by_repo)}: {str(e)}"
                 )
-                continue
+            finally:
+                # Signal that the batch is done
+                channel.send(None)
+
+        executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        try:
+            for checkpoints_by_repo in batches:
+                executor.submit(_run, checkpoints_by_repo)
+
+            remaining = len(batches)
+            while remaining:
+                message = channel.receive()
+                if message is None:
+                    remaining -= 1
+                    continue
+
+                kind, repo_full_name, payload = message
+                if kind == "page":
+                    yield from payload
+
+                # Update checkpoint once all pages of the repository were yielded,
+                # workers never touch the state so no locking is needed
+                elif payload:
+                    checkpoints[repo_full_name] = payload
+                    logger.info(
+                        f"Updated {name} checkpoint for {repo_full_name} to {payload}"
+                    )
+        finally:
+            # Stop the workers when done or when the generator is closed early
+            channel.stop()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @dlt.transformer(
+        data_from=repository_pages, primary_key="sha", write_disposition="merge"
+    )
+    def commits(page):
+        """Transform and load GitHub commits data with checkpointing.
+        Repositories are fetched concurrently by a bounded pool of workers,
+        in batches of aliased GraphQL queries when `use_graphql` is enabled.
+
+        Args:
+            page: Repository page from GitHub API
+
+        Yields:
+            Individual commits for each repository, as soon as their page arrives
+        """
+        # GraphQL aliases several repositories into one query, REST takes one at a time
+        batch_size = GRAPHQL_BATCH_SIZE if use_graphql else 1
+        yield from _load_with_checkpoints(
+            _fetch_commits, page["repositories"], batch_size, "commits"
+        )
+
+    @dlt.transformer(
+        data_from=repository_pages, primary_key="id", write_disposition="merge"
+    )
+    def workflow_runs(page):
+        """Transform and load GitHub workflow runs data with checkpointing.
+        Repositories are fetched concurrently by a bounded pool of workers,
+        while the time windows of a single repository are walked serially.
+
+        Args:
+            page: Repository page from GitHub API
+
+        Yields:
+            Individual workflow runs for each repository, as soon as their page arrives
+        """
+        yield from _load_with_checkpoints(
+            _fetch_workflow_runs, page["repositories"], 1, "workflow runs"
+        )
 
     return [repositories, commits, workflow_runs]
@@ -1,19 +1,291 @@
-import math
-from typing import Dict, Union
+import threading
+import time
+from functools import cached_property
+from queue import Full, Queue
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Union
 
+import orjson
 import pendulum
 from dlt.common import logger
 from dlt.common.exceptions import MissingDependencyException
+from dlt.sources.helpers.requests import Client
 from dlt.sources.helpers.rest_client.auth import OAuthJWTAuth
+from requests import PreparedRequest, Response, Session
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
+
+from .settings import (
+    CHANNEL_POLL_SECONDS,
+    GRAPHQL_MAX_PARENTS,
+    JWT_EXPIRATION_SECONDS,
+    PER_PAGE,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    RATE_LIMIT_THRESHOLD,
+    REST_API_BASE_URL,
+    RETRY_STATUS_FORCELIST,
+    TOKEN_REFRESH_MARGIN_SECONDS,
+)
+
+
+# Message kind ("page" or "done"), repository full name and page or latest record date
+TFetchMessage = Tuple[str, str, Any]
+
+
+class FetchChannel:
+    """Bounded channel handing fetched pages from worker threads to the extract pipe.
+
+    Workers block while the channel is full, so fetching never runs more than
+    `maxsize` pages ahead of the consumer. Once the consumer stops the channel,
+    sends are dropped and workers are expected to return.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._queue: "Queue[Optional[TFetchMessage]]" = Queue(maxsize=maxsize)
+        self.stopped = threading.Event()
+
+    def send(self, message: Optional[TFetchMessage]) -> bool:
+        """Put a message on the channel.
+
+        Args:
+            message: Message to send, `None` marks the end of a batch
+
+        Returns:
+            False when the consumer stopped and the message was dropped
+        """
+        while not self.stopped.is_set():
+            try:
+                self._queue.put(message, timeout=CHANNEL_POLL_SECONDS)
+                return True
+            except Full:
+                continue
+        return False
+
+    def receive(self) -> Optional[TFetchMessage]:
+        """Take the next message off the channel, waiting until one arrives."""
+        return self._queue.get()
+
+    def stop(self) -> None:
+        """Stop the channel, workers give up at their next send or rate limit pause."""
+        self.stopped.set()
+
+
+class OrjsonHTTPAdapter(HTTPAdapter):
+    """HTTP adapter that decodes JSON response bodies with orjson."""
+
+    def build_response(self, req: PreparedRequest, resp: Any) -> Response:
+        response = super().build_response(req, resp)
+        response.json = lambda **kwargs: orjson.loads(response.content)
+        return response
+
+
+def create_session() -> Session:
+    """Create an HTTP session with a pooled adapter on top of dlt's session.
+
+    Connections to the GitHub API are kept alive and reused across pages
+    and resources, so paginated calls do not pay a TLS handshake each time.
+    Timeouts and retries come from dlt's session and follow the runtime
+    `request_timeout` / `request_max_attempts` configuration.
+    JSON response bodies are decoded with orjson.
+
+    Returns:
+        Session configured with keep-alive and connection pooling
+    """
+    client = Client(
+        raise_for_status=False,
+        status_codes=RETRY_STATUS_FORCELIST,
+        respect_retry_after_header=True,
+    )
+    client.configure()
+
+    session = client.session
+    adapter = OrjsonHTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+    )
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    session.headers["Accept-Encoding"] = "gzip"
+    return session
+
+
+COMMIT_FIELDS_FRAGMENT = """
+fragment UserFields on User { login databaseId id avatarUrl url isSiteAdmin }
+
+fragment CommitFields on Commit {
+  oid
+  id
+  url
+  message
+  tree { oid }
+  parents(first: %d) { nodes { oid } }
+  comments { totalCount }
+  signature { isValid state signature payload }
+  author { name email date user { ...UserFields } }
+  committer { name email date user { ...UserFields } }
+}
+""" % GRAPHQL_MAX_PARENTS
+
+
+def build_commits_query(batch_size: int) -> str:
+    """Build a GraphQL query fetching default branch commits of several repositories.
+
+    Each repository is aliased as `repo<i>` and takes its own `owner<i>`,
+    `name<i>`, `since<i>` and `after<i>` variables.
+
+    Args:
+        batch_size: Number of repositories in the query
+
+    Returns:
+        GraphQL query string
+    """
+    variables = []
+    aliases = []
+    for i in range(batch_size):
+        variables.append(
+            f"$owner{i}: String!, $name{i}: String!, $since{i}: GitTimestamp, $after{i}: String"
+        )
+        aliases.append(
+            f"repo{i}: repository(owner: $owner{i}, name: $name{i}) {{"
+            f" defaultBranchRef {{ target {{ ... on Commit {{"
+            f" history(first: {PER_PAGE}, since: $since{i}, after: $after{i}) {{"
+            f" nodes {{ ...CommitFields }} pageInfo {{ hasNextPage endCursor }}"
+            f" }} }} }} }} }}"
+        )
+    return (
+        f"query({', '.join(variables)}) {{\n  "
+        + "\n  ".join(aliases)
+        + "\n}\n"
+        + COMMIT_FIELDS_FRAGMENT
+    )
+
+
+def graphql_commit_to_rest(node: Dict[str, Any], repo_full_name: str) -> Dict[str, Any]:
+    """Map a GraphQL commit node onto the shape of the REST commits endpoint.
+
+    Fields GraphQL does not expose, such as `commit.verification.verified_at`
+    and the `*_url` templates of users, are left out.
+
+    Args:
+        node: Commit node returned by the GraphQL API
+        repo_full_name: Full name of the repository (owner/name)
+
+    Returns:
+        Commit record with the REST field layout
+    """
+    commits_url = f"{REST_API_BASE_URL}/repos/{repo_full_name}/commits"
+    html_commits_url = node["url"].rsplit("/", 1)[0]
+
+    def _signature(person: Dict[str, Any]) -> Dict[str, Any]:
+        return {"name": person["name"], "email": person["email"], "date": person["date"]}
+
+    def _user(person: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        user = person.get("user")
+        if not user:
+            return None
+        return {
+            "login": user["login"],
+            "id": user["databaseId"],
+            "node_id": user["id"],
+            "avatar_url": user["avatarUrl"],
+            "url": f"{REST_API_BASE_URL}/users/{user['login']}",
+            "html_url": user["url"],
+            "type": "User",
+            "site_admin": user["isSiteAdmin"],
+        }
+
+    signature = node.get("signature")
+    return {
+        "sha": node["oid"],
+        "node_id": node["id"],
+        "url": f"{commits_url}/{node['oid']}",
+        "html_url": node["url"],
+        "comments_url": f"{commits_url}/{node['oid']}/comments",
+        "commit": {
+            "message": node["message"],
+            "author": _signature(node["author"]),
+            "committer": _signature(node["committer"]),
+            "tree": {
+                "sha": node["tree"]["oid"],
+                "url": f"{REST_API_BASE_URL}/repos/{repo_full_name}/git/trees/{node['tree']['oid']}",
+            },
+            "url": f"{REST_API_BASE_URL}/repos/{repo_full_name}/git/commits/{node['oid']}",
+            "comment_count": node["comments"]["totalCount"],
+            "verification": {
+                "verified": signature["isValid"] if signature else False,
+                "reason": signature["state"].lower() if signature else "unsigned",
+                "signature": signature["signature"] if signature else None,
+                "payload": signature["payload"] if signature else None,
+            },
+        },
+        "author": _user(node["author"]),
+        "committer": _user(node["committer"]),
+        "parents": [
+            {
+                "sha": parent["oid"],
+                "url": f"{commits_url}/{parent['oid']}",
+                "html_url": f"{html_commits_url}/{parent['oid']}",
+            }
+            for parent in node["parents"]["nodes"]
+        ],
+    }
+
+
+def wait_for_rate_limit(
+    response: Response, sleep: Callable[[float], Any] = time.sleep
+) -> None:
+    """Pause until the rate limit window resets when few requests remain.
+
+    Args:
+        response: Response carrying GitHub's X-RateLimit-* headers
+        sleep: Function used to pause, e.g. an event's `wait` to make the pause interruptible
+    """
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    reset = response.headers.get("X-RateLimit-Reset")
+    if remaining is None or reset is None or int(remaining) >= RATE_LIMIT_THRESHOLD:
+        return
+
+    delay = max(int(reset) - time.time(), 0)
+    logger.warning(
+        f"GitHub rate limit nearly exhausted ({remaining} remaining), sleeping for {delay:.0f}s"
+    )
+    sleep(delay)
 
 
 class GitHubAppAuth(OAuthJWTAuth):
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        # Serializes token refreshes between worker threads sharing this auth
+        self._token_lock = threading.Lock()
+
+    def __call__(self, r: PreparedRequest) -> PreparedRequest:
+        if self.token is None or self.is_token_expired():
+            with self._token_lock:
+                # Another thread may have refreshed the token while we waited
+                if self.token is None or self.is_token_expired():
+                    self.obtain_token()
+        r.headers["Authorization"] = f"Bearer {self.token}"
+        return r
+
+    def is_token_expired(self) -> bool:
+        """Treat the token as expired shortly before it does, to refresh it proactively."""
+        return not self.token_expiry or pendulum.now() >= self.token_expiry.subtract(
+            seconds=TOKEN_REFRESH_MARGIN_SECONDS
+        )
+
+    @cached_property
+    def _private_key(self) -> "PrivateKeyTypes":
+        """Private key parsed once and reused for every JWT signing."""
+        return self.load_private_key()
+
     def create_jwt_payload(self) -> Dict[str, Union[str, int]]:
-        now = pendulum.now()
+        now = int(time.time())
         return {
             "iss": self.client_id,
-            "exp": math.floor((now.add(minutes=10)).timestamp()),
-            "iat": math.floor(now.timestamp()),
+            "exp": now + JWT_EXPIRATION_SECONDS,
+            "iat": now,
         }
 
     def obtain_token(self) -> None:
@@ -24,7 +296,7 @@ class GitHubAppAuth(OAuthJWTAuth):
 
         payload = self.create_jwt_payload()
         obtain_token_headers = {
-            "Authorization": f"Bearer {jwt.encode(payload, self.load_private_key(), algorithm='RS256')}"
+            "Authorization": f"Bearer {jwt.encode(payload, self._private_key, algorithm='RS256')}"
         }
 
         logger.debug(f"Obtaining token from {self.auth_endpoint}")
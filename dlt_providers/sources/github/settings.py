@@ -1,2 +1,35 @@
 REST_API_BASE_URL = "https://api.github.com"
 DEFAULT_START_DATE = "1970-01-01T00:00:00Z"
+
+# Page size for paginated endpoints and GitHub's cap on results per search query
+PER_PAGE = 100
+MAX_RESULTS_PER_QUERY = 1000
+
+# Number of repositories aliased into a single GraphQL commits query
+GRAPHQL_BATCH_SIZE = 50
+
+# Parents fetched per commit via GraphQL, only octopus merges have more
+GRAPHQL_MAX_PARENTS = 10
+
+# Lifetime of the GitHub App JWT, GitHub allows at most 10 minutes
+JWT_EXPIRATION_SECONDS = 600
+
+# Refresh installation tokens this long before they expire
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+
+# Number of repositories fetched concurrently
+MAX_WORKERS = 8
+
+# Pages buffered between fetching workers and the extract pipe
+PAGE_QUEUE_SIZE = 16
+
+# How often blocked workers check whether the consumer stopped
+CHANNEL_POLL_SECONDS = 1
+
+# Pause requests when fewer calls than this remain in the rate limit window
+RATE_LIMIT_THRESHOLD = 100
+
+# HTTP connection pool settings and status codes retried by dlt's session
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 32
+RETRY_STATUS_FORCELIST = [429, 502, 503, 504]
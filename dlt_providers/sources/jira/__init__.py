@@ -13,6 +13,11 @@ from dlt.sources.rest_api import RESTAPIConfig, rest_api_resources
 from .settings import DEFAULT_START_DATE, REST_API_BASE_URL
 
 
+def _jql_since(start_value: str) -> str:
+    """Build the JQL filter for issues updated since the incremental start value."""
+    return f"updated >= '{pendulum.parse(start_value).format('YYYY-MM-DD HH:mm')}'"
+
+
 @dlt.source(max_table_nesting=0)
 def jira(
     subdomain: str = dlt.secrets.value,
@@ -61,7 +66,7 @@ def jira(
                         "start_param": "jql",
                         "cursor_path": "fields.updated",
                         "initial_value": start_date,
-                        "convert": lambda start_value: f"updated >= '{pendulum.parse(start_value).format('YYYY-MM-DD HH:mm')}'",
+                        "convert": _jql_since,
                     },
                     "params": {
                         "fields": "*all",